@@ -1,62 +1,68 @@
 # lexical_analyzer.py
-from enum import Enum
-from typing import List, Dict, Optional, Set
+from enum import IntEnum, auto
+from sys import intern
+from typing import List, Dict, Iterator, Optional, Set, Tuple, ClassVar
 import re
 
-class TokenType(Enum):
+class TokenType(IntEnum):
+    # Members are plain ints, so comparing token types is an integer
+    # comparison; lexemes live in the LexicalAnalyzer lookup tables
+
     # Single characters
-    LPAREN = '('
-    RPAREN = ')'
-    LBRACE = '{'
-    RBRACE = '}'
-    COMMA = ','
-    SEMICOLON = ';'
-    PLUS = '+'
-    MINUS = '-'
-    STAR = '*'
-    SLASH = '/'
-    PERCENT = '%'
-    LESS = '<'
-    GREATER = '>'
-    EQUAL = '='
-    BANG = '!'
-    LBRACKET = '['
-    RBRACKET = ']'
+    LPAREN = auto()
+    RPAREN = auto()
+    LBRACE = auto()
+    RBRACE = auto()
+    COMMA = auto()
+    SEMICOLON = auto()
+    PLUS = auto()
+    MINUS = auto()
+    STAR = auto()
+    SLASH = auto()
+    PERCENT = auto()
+    LESS = auto()
+    GREATER = auto()
+    EQUAL = auto()
+    BANG = auto()
+    LBRACKET = auto()
+    RBRACKET = auto()
     
     # Double characters
-    LE = '<='
-    GE = '>='
-    EQ = '=='
-    NE = '!='
-    OR = '||'
-    AND = '&&'
+    LE = auto()
+    GE = auto()
+    EQ = auto()
+    NE = auto()
+    OR = auto()
+    AND = auto()
     
     # Keywords
-    IF = 'if'
-    ELSE = 'else'
-    WHILE = 'while'
-    FOR = 'for'
-    RETURN = 'return'
-    BREAK = 'break'
-    NEW = 'new'
-    SIZE = 'size'
+    IF = auto()
+    ELSE = auto()
+    WHILE = auto()
+    FOR = auto()
+    RETURN = auto()
+    BREAK = auto()
+    NEW = auto()
+    SIZE = auto()
     
     # Types
-    VOID = 'void'
-    BOOL = 'bool'
-    INT = 'int'
-    FLOAT = 'float'
+    VOID = auto()
+    BOOL = auto()
+    INT = auto()
+    FLOAT = auto()
     
     # Literals and Identifier
-    BOOL_LIT = 'BOOL_LIT'
-    INT_LIT = 'INT_LIT'
-    FLOAT_LIT = 'FLOAT_LIT'
-    IDENTIFIER = 'IDENTIFIER'
+    BOOL_LIT = auto()
+    INT_LIT = auto()
+    FLOAT_LIT = auto()
+    IDENTIFIER = auto()
     
     # End of file
-    EOF = 'EOF'
+    EOF = auto()
 
 class Token:
+    __slots__ = ('type', 'value', 'line', 'column')
+
     def __init__(self, type: TokenType, value: str, line: int, column: int):
         self.type = type
         self.value = value
@@ -67,19 +73,22 @@ class Token:
         return f"Token(type={self.type.name}, value='{self.value}', line={self.line}, column={self.column})"
 
 class SymbolInfo:
+    __slots__ = ('name', 'type', 'is_local', 'array_length', 'return_type',
+                 'param_types', 'local_var_count')
+
     def __init__(self, name: str, type_: str, is_local: bool = True):
         self.name = name
         self.type = type_
         self.is_local = is_local
         self.array_length = -1  # -1 for non-arrays
-        self.return_type = None  # for functions
-        self.param_types = []    # for functions
-        self.local_var_count = 0 # for functions
+        self.return_type: Optional[str] = None  # for functions
+        self.param_types: List[str] = []        # for functions
+        self.local_var_count = 0                # for functions
 
 class SymbolTable:
     def __init__(self, name: str):
         self.symbols: Dict[str, SymbolInfo] = {}
-        self.parent = None
+        self.parent: Optional[SymbolTable] = None
         self.name = name
     
     def insert(self, name: str, info: SymbolInfo):
@@ -105,25 +114,35 @@ class LexicalError(Exception):
         self.column = column
         super().__init__(f"Line {line}, Column {column}: {message}")
 
+KEYWORDS = {
+    'if': TokenType.IF,
+    'else': TokenType.ELSE,
+    'while': TokenType.WHILE,
+    'for': TokenType.FOR,
+    'return': TokenType.RETURN,
+    'break': TokenType.BREAK,
+    'new': TokenType.NEW,
+    'size': TokenType.SIZE,
+    'void': TokenType.VOID,
+    'bool': TokenType.BOOL,
+    'int': TokenType.INT,
+    'float': TokenType.FLOAT,
+    'true': TokenType.BOOL_LIT,
+    'false': TokenType.BOOL_LIT
+}
+
+# Keywords grouped by length, so most identifiers are rejected
+# without being compared against any keyword
+KEYWORDS_BY_LENGTH: Dict[int, Dict[str, TokenType]] = {}
+for keyword, keyword_type in KEYWORDS.items():
+    KEYWORDS_BY_LENGTH.setdefault(len(keyword), {})[keyword] = keyword_type
+del keyword, keyword_type
+
 class LexicalAnalyzer:
-    KEYWORDS = {
-        'if': TokenType.IF,
-        'else': TokenType.ELSE,
-        'while': TokenType.WHILE,
-        'for': TokenType.FOR,
-        'return': TokenType.RETURN,
-        'break': TokenType.BREAK,
-        'new': TokenType.NEW,
-        'size': TokenType.SIZE,
-        'void': TokenType.VOID,
-        'bool': TokenType.BOOL,
-        'int': TokenType.INT,
-        'float': TokenType.FLOAT,
-        'true': TokenType.BOOL_LIT,
-        'false': TokenType.BOOL_LIT
-    }
-    
-    OPERATORS = {
+    KEYWORDS: ClassVar[Dict[str, TokenType]] = KEYWORDS
+    KEYWORDS_BY_LENGTH: ClassVar[Dict[int, Dict[str, TokenType]]] = KEYWORDS_BY_LENGTH
+
+    OPERATORS: ClassVar[Dict[str, TokenType]] = {
         '<=': TokenType.LE,
         '>=': TokenType.GE,
         '==': TokenType.EQ,
@@ -132,14 +151,63 @@ class LexicalAnalyzer:
         '&&': TokenType.AND
     }
 
-    def __init__(self, source_code: str):
+    SINGLE_CHARS: ClassVar[Dict[str, TokenType]] = {
+        '(': TokenType.LPAREN,
+        ')': TokenType.RPAREN,
+        '{': TokenType.LBRACE,
+        '}': TokenType.RBRACE,
+        ',': TokenType.COMMA,
+        ';': TokenType.SEMICOLON,
+        '+': TokenType.PLUS,
+        '-': TokenType.MINUS,
+        '*': TokenType.STAR,
+        '/': TokenType.SLASH,
+        '%': TokenType.PERCENT,
+        '<': TokenType.LESS,
+        '>': TokenType.GREATER,
+        '=': TokenType.EQUAL,
+        '!': TokenType.BANG,
+        '[': TokenType.LBRACKET,
+        ']': TokenType.RBRACKET
+    }
+
+    # Every character of the source is covered by exactly one match, so a
+    # single finditer pass tokenizes the whole input. Alternatives are tried
+    # in order: comments before '/', two-character operators before their
+    # one-character prefixes, and ERROR last to catch anything else. MyC
+    # source is ASCII; explicit character classes compile to bitmap lookups
+    # in the regex engine instead of Unicode category checks.
+    SCAN_PATTERN: ClassVar[re.Pattern] = re.compile(r'''
+        (?P<TRIVIA>(?:[ \t\n\r\f\v\x1c-\x1f]+|//[^\n]*|/\*.*?\*/)+)
+      | (?P<UNTERMINATED_COMMENT>/\*)
+      | (?P<NUMBER>[0-9]+(?:\.[0-9]*)?)
+      | (?P<IDENTIFIER>[A-Za-z_][A-Za-z0-9_]*)
+      | (?P<OPERATOR><=|>=|==|!=|\|\||&&)
+      | (?P<PUNCTUATION>[(){}\[\],;+\-*/%<>=!])
+      | (?P<ERROR>.)
+    ''', re.VERBOSE | re.DOTALL)
+
+    def __init__(self, source_code: str, *, verbose: bool = False):
         self.source = source_code
+        self.verbose = verbose
         self.position = 0
         self.line = 1
         self.column = 1
         self.tokens: List[Token] = []
         self.symbol_table = SymbolTable("global")
         self.initialize_built_in_functions()
+        self.line_starts = self.find_line_starts()
+        self.scanner = self.scan()
+
+    def find_line_starts(self) -> List[int]:
+        # Offset of the first character of every line, for locate()
+        source = self.source
+        line_starts = [0]
+        newline = source.find('\n')
+        while newline >= 0:
+            line_starts.append(newline + 1)
+            newline = source.find('\n', newline + 1)
+        return line_starts
 
     def initialize_built_in_functions(self):
         # Add read function
@@ -154,137 +222,110 @@ class LexicalAnalyzer:
         write_info.param_types = ["any"]
         self.symbol_table.insert("write", write_info)
 
-    def analyze(self) -> List[Token]:
+    def __iter__(self) -> Iterator[Token]:
+        # Goes through next_token so a LexicalError leaves the lexer able
+        # to resume after the bad input. Iteration continues from the current
+        # position rather than restarting, so once the source has been
+        # consumed a new iteration only yields EOF.
         while True:
             token = self.next_token()
-            self.tokens.append(token)
+            yield token
             if token.type == TokenType.EOF:
-                break
-            print(token)
-        
-        self.symbol_table.print_table()
+                return
+
+    def analyze(self) -> List[Token]:
+        for token in self:
+            self.tokens.append(token)
+            if self.verbose and token.type != TokenType.EOF:
+                print(token)
+
+        if self.verbose:
+            self.symbol_table.print_table()
         return self.tokens
 
     def next_token(self) -> Token:
-        self.skip_whitespace()
-        
-        if self.position >= len(self.source):
+        try:
+            token = next(self.scanner, None)
+        except LexicalError:
+            # The failed generator is finished; resume after the bad input
+            self.scanner = self.scan()
+            raise
+        if token is None:
             return Token(TokenType.EOF, "", self.line, self.column)
+        return token
 
-        char = self.source[self.position]
-
-        # Handle comments
-        if char == '/':
-            if self.position + 1 < len(self.source):
-                next_char = self.source[self.position + 1]
-                if next_char == '/':
-                    self.skip_line_comment()
-                    return self.next_token()
-                elif next_char == '*':
-                    self.skip_block_comment()
-                    return self.next_token()
-
-        # Handle numbers
-        if char.isdigit():
-            return self.scan_number()
-
-        # Handle identifiers and keywords
-        if char.isalpha() or char == '_':
-            return self.scan_identifier()
-
-        # Handle operators and punctuation
-        if self.position + 1 < len(self.source):
-            op = self.source[self.position:self.position + 2]
-            if op in self.OPERATORS:
-                self.position += 2
-                self.column += 2
-                return Token(self.OPERATORS[op], op, self.line, self.column - 2)
-
-        # Single character tokens
-        self.position += 1
-        self.column += 1
-        for token_type in TokenType:
-            if token_type.value == char:
-                return Token(token_type, char, self.line, self.column - 1)
-
-        raise LexicalError(f"Unexpected character: {char}", self.line, self.column - 1)
-
-    def skip_whitespace(self):
-        while self.position < len(self.source) and self.source[self.position].isspace():
-            if self.source[self.position] == '\n':
-                self.line += 1
-                self.column = 1
-            else:
-                self.column += 1
-            self.position += 1
-
-    def skip_line_comment(self):
-        self.position += 2  # Skip //
-        while self.position < len(self.source) and self.source[self.position] != '\n':
-            self.position += 1
-
-    def skip_block_comment(self):
-        self.position += 2  # Skip /*
-        while self.position < len(self.source) - 1:
-            if (self.source[self.position] == '*' and 
-                self.source[self.position + 1] == '/'):
-                self.position += 2
-                return
-            if self.source[self.position] == '\n':
-                self.line += 1
-                self.column = 1
+    def scan(self) -> Iterator[Token]:
+        for match in self.SCAN_PATTERN.finditer(self.source, self.position):
+            kind = match.lastgroup
+            if kind == 'TRIVIA':
+                continue
+            self.line, self.column = self.locate(match.start())
+            # Moved past the match first, so scanning can resume after an error
+            self.position = match.end()
+            if kind == 'IDENTIFIER':
+                token = self.scan_identifier(match)
+            elif kind == 'PUNCTUATION':
+                token = self.scan_punctuation(match)
+            elif kind == 'NUMBER':
+                token = self.scan_number(match)
+            elif kind == 'OPERATOR':
+                token = self.scan_operator(match)
+            elif kind == 'UNTERMINATED_COMMENT':
+                # The rest of the input is inside the comment
+                self.position = len(self.source)
+                raise LexicalError("Unterminated block comment", self.line, self.column)
             else:
-                self.column += 1
-            self.position += 1
-        raise LexicalError("Unterminated block comment", self.line, self.column)
-
-    def scan_number(self) -> Token:
-        start_column = self.column
-        number = ""
-        is_float = False
-        
-        while self.position < len(self.source):
-            char = self.source[self.position]
-            if char.isdigit():
-                number += char
-                self.position += 1
-                self.column += 1
-            elif char == '.' and not is_float:
-                number += char
-                is_float = True
-                self.position += 1
-                self.column += 1
-            else:
-                break
+                raise LexicalError(f"Unexpected character: {match.group()}",
+                                   self.line, self.column)
+            yield token
+
+        self.position = len(self.source)
+        self.line, self.column = self.locate(self.position)
+        yield Token(TokenType.EOF, "", self.line, self.column)
 
-        if is_float:
+    def locate(self, position: int) -> Tuple[int, int]:
+        # Line and column are only needed where a token starts, so they are
+        # looked up from the offset instead of being tracked per character.
+        # scan() only moves forward, so the search resumes from self.line.
+        line_starts = self.line_starts
+        line = self.line
+        while line < len(line_starts) and line_starts[line] <= position:
+            line += 1
+        return line, position - line_starts[line - 1] + 1
+
+    def scan_number(self, match: re.Match) -> Token:
+        number = match.group()
+        if '.' in number:
             if number.endswith('.'):
-                raise LexicalError("Invalid float literal", self.line, start_column)
-            return Token(TokenType.FLOAT_LIT, number, self.line, start_column)
-        return Token(TokenType.INT_LIT, number, self.line, start_column)
-
-    def scan_identifier(self) -> Token:
-        start_column = self.column
-        identifier = ""
-        
-        while self.position < len(self.source):
-            char = self.source[self.position]
-            if char.isalnum() or char == '_':
-                identifier += char
-                self.position += 1
-                self.column += 1
-            else:
-                break
+                raise LexicalError("Invalid float literal", self.line, self.column)
+            return Token(TokenType.FLOAT_LIT, number, self.line, self.column)
+        return Token(TokenType.INT_LIT, number, self.line, self.column)
+
+    def scan_identifier(self, match: re.Match) -> Token:
+        # Interned so every occurrence of a name shares one string object
+        identifier = intern(match.group())
 
         # Check if it's a keyword
-        if identifier in self.KEYWORDS:
-            return Token(self.KEYWORDS[identifier], identifier, self.line, start_column)
+        keywords = self.KEYWORDS_BY_LENGTH.get(len(identifier))
+        keyword = keywords.get(identifier) if keywords else None
+        if keyword is not None:
+            return Token(keyword, identifier, self.line, self.column)
+
+        # Add to symbol table if it's an identifier; the lexer only ever
+        # fills the global scope, so there are no parents to search
+        symbols = self.symbol_table.symbols
+        if identifier not in symbols:
+            symbols[identifier] = SymbolInfo(identifier, "unknown")
+
+        return Token(TokenType.IDENTIFIER, identifier, self.line, self.column)
 
-        # Add to symbol table if it's an identifier
-        if not self.symbol_table.lookup(identifier):
-            self.symbol_table.insert(identifier, SymbolInfo(identifier, "unknown"))
+    def scan_operator(self, match: re.Match) -> Token:
+        op = match.group()
+        return Token(self.OPERATORS[op], op, self.line, self.column)
 
-        return Token(TokenType.IDENTIFIER, identifier, self.line, start_column)
+    def scan_punctuation(self, match: re.Match) -> Token:
+        char = match.group()
+        return Token(self.SINGLE_CHARS[char], char, self.line, self.column)
 
 # Example usage and test
 def main():
@@ -303,7 +344,7 @@ def main():
     """
     
     try:
-        lexer = LexicalAnalyzer(sample_program)
+        lexer = LexicalAnalyzer(sample_program, verbose=True)
         tokens = lexer.analyze()
     except LexicalError as e:
         print(f"Error: {e}")
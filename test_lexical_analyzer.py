@@ -1,4 +1,6 @@
 # test_lexical_analyzer.py
+import contextlib
+import io
 import unittest
 from lexical_analyzer import TokenType, LexicalAnalyzer, LexicalError
 
@@ -52,6 +54,49 @@ class TestLexicalAnalyzer(unittest.TestCase):
         for token, expected_type in zip(tokens, operator_types):
             self.assertEqual(token.type, expected_type)
 
+    def test_iteration(self):
+        source = "x = 1;"
+        lexer = LexicalAnalyzer(source)
+        tokens = iter(lexer)
+
+        self.assertEqual(next(tokens).type, TokenType.IDENTIFIER)
+        self.assertEqual(lexer.tokens, [])
+        self.assertEqual([token.type for token in tokens], [
+            TokenType.EQUAL, TokenType.INT_LIT, TokenType.SEMICOLON, TokenType.EOF
+        ])
+
+    def test_analyze_is_silent_by_default(self):
+        source = "int x;"
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            LexicalAnalyzer(source).analyze()
+
+        self.assertEqual(output.getvalue(), "")
+
+    def test_analyze_verbose_output(self):
+        source = "int x;"
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            LexicalAnalyzer(source, verbose=True).analyze()
+
+        self.assertIn("Token(type=INT, value='int', line=1, column=1)", output.getvalue())
+        self.assertIn("Token(type=SEMICOLON, value=';', line=1, column=6)", output.getvalue())
+        self.assertIn("Symbol Table for scope: global", output.getvalue())
+
+    def test_iteration_is_one_shot(self):
+        source = "x;"
+        lexer = LexicalAnalyzer(source)
+
+        self.assertEqual(len(list(lexer)), 3)
+        self.assertEqual([token.type for token in lexer], [TokenType.EOF])
+
+        lexer = LexicalAnalyzer(source)
+        lexer.analyze()
+        tokens = lexer.analyze()
+        self.assertEqual([token.type for token in tokens], [
+            TokenType.IDENTIFIER, TokenType.SEMICOLON, TokenType.EOF, TokenType.EOF
+        ])
+
     def test_invalid_character(self):
         source = "int x = @;"
         lexer = LexicalAnalyzer(source)
@@ -64,6 +109,25 @@ class TestLexicalAnalyzer(unittest.TestCase):
         with self.assertRaises(LexicalError):
             lexer.analyze()
 
+    def test_non_ascii_identifier(self):
+        source = "int caf\u00e9;"
+        lexer = LexicalAnalyzer(source)
+        with self.assertRaises(LexicalError):
+            lexer.analyze()
+
+    def test_ascii_whitespace(self):
+        source = "x\x1cy\x1f\vz"
+        lexer = LexicalAnalyzer(source)
+        tokens = lexer.analyze()
+
+        self.assertEqual([token.value for token in tokens], ["x", "y", "z", ""])
+
+    def test_non_ascii_whitespace(self):
+        source = "x\u00a0y"
+        lexer = LexicalAnalyzer(source)
+        with self.assertRaises(LexicalError):
+            lexer.analyze()
+
     # def test_invalid_float(self):
     #     source = "123."
     #     lexer = LexicalAnalyzer(source)
@@ -102,6 +166,57 @@ class TestLexicalAnalyzer(unittest.TestCase):
         self.assertEqual(tokens[5].type, TokenType.RETURN)
         self.assertEqual(tokens[6].type, TokenType.IDENTIFIER)
 
+    def test_identifiers_are_interned(self):
+        source = "count = count + 1;"
+        lexer = LexicalAnalyzer(source)
+        tokens = lexer.analyze()
+
+        self.assertIs(tokens[0].value, tokens[2].value)
+
+    def test_token_positions(self):
+        source = "int x; /* a\n  b */ y // c\n  z"
+        lexer = LexicalAnalyzer(source)
+        tokens = lexer.analyze()
+
+        positions = [(token.line, token.column) for token in tokens]
+        self.assertEqual(positions, [(1, 1), (1, 5), (1, 6), (2, 8), (3, 3), (3, 4)])
+
+    def test_error_position(self):
+        source = "int x;\n// comment\n  x = @;"
+        lexer = LexicalAnalyzer(source)
+        with self.assertRaises(LexicalError) as context:
+            lexer.analyze()
+
+        self.assertEqual((context.exception.line, context.exception.column), (3, 7))
+
+    def test_next_token_after_error(self):
+        source = "a @ b"
+        lexer = LexicalAnalyzer(source)
+
+        self.assertEqual(lexer.next_token().value, "a")
+        with self.assertRaises(LexicalError):
+            lexer.next_token()
+        token = lexer.next_token()
+        self.assertEqual((token.type, token.value, token.column), (TokenType.IDENTIFIER, "b", 5))
+        self.assertEqual(lexer.next_token().type, TokenType.EOF)
+
+    def test_analyze_after_error(self):
+        source = "a @ b"
+        lexer = LexicalAnalyzer(source)
+        with self.assertRaises(LexicalError):
+            lexer.analyze()
+
+        self.assertEqual(lexer.next_token().value, "b")
+        self.assertEqual(lexer.next_token().type, TokenType.EOF)
+
+        lexer = LexicalAnalyzer(source)
+        with self.assertRaises(LexicalError):
+            lexer.analyze()
+        tokens = lexer.analyze()
+
+        self.assertEqual([token.value for token in tokens], ["a", "b", ""])
+        self.assertEqual(tokens[-1].type, TokenType.EOF)
+
     def test_unterminated_block_comment(self):
         source = "/* This is an unterminated comment"
         lexer = LexicalAnalyzer(source)